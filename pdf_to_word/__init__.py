@@ -1,5 +1,5 @@
 """PDF to Word (DOCX) converter — preserves images, tables, links, and layout."""
 
-from pdf_to_word.converter import convert_pdf_to_docx
+from pdf_to_word.converter import convert_many, convert_pdf_to_docx
 
-__all__ = ["convert_pdf_to_docx"]
+__all__ = ["convert_many", "convert_pdf_to_docx"]
@@ -6,7 +6,7 @@ import argparse
 import sys
 from pathlib import Path
 
-from pdf_to_word.converter import convert_pdf_to_docx
+from pdf_to_word.converter import convert_many, convert_pdf_to_docx
 
 
 def main(argv: list[str] | None = None) -> None:
@@ -15,12 +15,18 @@ def main(argv: list[str] | None = None) -> None:
         description="Convert a PDF to an editable Word (.docx) document "
         "preserving text, images, tables, links, and layout.",
     )
-    parser.add_argument("pdf", help="Path to the input PDF file.")
+    parser.add_argument(
+        "pdf",
+        nargs="+",
+        help="Path(s) to the input PDF file(s). Several files convert "
+        "in parallel across worker processes.",
+    )
     parser.add_argument(
         "-o",
         "--output",
         default=None,
-        help="Output DOCX path. Defaults to <input>.docx.",
+        help="Output DOCX path (or directory, when converting several "
+        "PDFs). Defaults to <input>.docx.",
     )
     parser.add_argument(
         "-p",
@@ -29,6 +35,16 @@ def main(argv: list[str] | None = None) -> None:
         help="Comma-separated 0-based page numbers to convert (e.g. 0,1,3). "
         "Defaults to all pages.",
     )
+    parser.add_argument(
+        "-m",
+        "--mode",
+        choices=["hybrid", "editable", "exact", "image"],
+        default="hybrid",
+        help="Conversion mode: 'hybrid' (pdf2docx + post-processing, default), "
+        "'editable' (rebuild pages as positioned text boxes and images), "
+        "'exact' (page rasters with an invisible searchable text overlay), "
+        "or 'image' (plain page rasters, no text layer).",
+    )
     parser.add_argument(
         "--dpi",
         type=int,
@@ -45,10 +61,11 @@ def main(argv: list[str] | None = None) -> None:
 
     args = parser.parse_args(argv)
 
-    pdf_path = Path(args.pdf)
-    if not pdf_path.exists():
-        print(f"Error: file not found: {pdf_path}", file=sys.stderr)
-        sys.exit(1)
+    pdf_paths = [Path(p) for p in args.pdf]
+    for pdf_path in pdf_paths:
+        if not pdf_path.exists():
+            print(f"Error: file not found: {pdf_path}", file=sys.stderr)
+            sys.exit(1)
 
     pages = None
     if args.pages:
@@ -58,15 +75,29 @@ def main(argv: list[str] | None = None) -> None:
             print("Error: --pages must be comma-separated integers.", file=sys.stderr)
             sys.exit(1)
 
-    out = convert_pdf_to_docx(
-        pdf_path,
-        args.output,
-        pages=pages,
-        dpi=args.dpi,
-        verbose=args.verbose,
-    )
+    if len(pdf_paths) == 1:
+        outputs = [
+            convert_pdf_to_docx(
+                pdf_paths[0],
+                args.output,
+                mode=args.mode,
+                pages=pages,
+                dpi=args.dpi,
+                verbose=args.verbose,
+            )
+        ]
+    else:
+        outputs = convert_many(
+            pdf_paths,
+            args.output,
+            mode=args.mode,
+            pages=pages,
+            dpi=args.dpi,
+            verbose=args.verbose,
+        )
 
-    print(f"Saved: {out}")
+    for out in outputs:
+        print(f"Saved: {out}")
 
 
 if __name__ == "__main__":
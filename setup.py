@@ -10,8 +10,15 @@ setup(
         "pdf2docx>=0.5.8",
         "python-docx>=1.1.0",
         "PyMuPDF>=1.24.0",
+        "numpy>=1.24",
+        # Binary wheels bundle libjpeg-turbo; pillow-simd drops in as a
+        # faster replacement for the JPEG page-encode path.
         "Pillow>=10.0.0",
     ],
+    extras_require={
+        "fast": ["numba>=0.57", "scipy>=1.10"],
+        "pdfium": ["pypdfium2>=4.0"],
+    },
     entry_points={
         "console_scripts": [
             "pdf-to-word=pdf_to_word.cli:main",